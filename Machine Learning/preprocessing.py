@@ -1,14 +1,247 @@
 import pandas as pd
-import math
+import numpy as np
 import re
+import functools
 import nltk
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 from bs4 import BeautifulSoup
-from collections import Counter, OrderedDict
+from joblib import Parallel, delayed, effective_n_jobs
 
-nltk.download('stopwords')
-nltk.download('wordnet')
+def _ensure_nltk_corpus(name: str) -> None:
+    """
+    Download an NLTK corpus only when it is missing, joblib workers re-import this module.
+    The trailing '/' lets nltk.data.find also locate zipped corpora (e.g. wordnet.zip).
+    """
+    try:
+        nltk.data.find(f'corpora/{name}/')
+    except LookupError:
+        nltk.download(name)
+
+_ensure_nltk_corpus('stopwords')
+_ensure_nltk_corpus('wordnet')
+
+# Loaded once, reused by every preprocess_mail_content call
+_STOP_WORDS = frozenset(stopwords.words())
+_LEMMATIZER = WordNetLemmatizer()
+
+@functools.lru_cache(maxsize=200_000)
+def _lemma(word: str) -> str:
+    """
+    Memoized WordNet lemmatization, word frequencies in emails are heavily skewed.
+    """
+    return _LEMMATIZER.lemmatize(word)
+
+# Regex patterns
+RE_EMAIL_ONLY = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$', re.I)
+RE_PAREN_NAME = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+\s*\([^)]+\)\s*$', re.I)
+RE_PAREN_EMPTY = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+\s*\(\s*\)\s*$', re.I)
+RE_DISPLAY_ANGLE = re.compile(r'^(?P<disp>.*?)(?P<addr><\s*[^>]+@[^>]+\s*>)\s*$', re.I)
+RE_QUOTED_NAME_ANG = re.compile(r'^"\s*[^"]+\s*"\s*<[^>]+>$', re.I)
+RE_LAST_COMMA_FIRST = re.compile(r'^"?[^",<>]+,[^",<>]+"\s*<[^>]+>$', re.I)
+NAME_CHARS = r"A-Za-zÀ-ÖØ-öø-ÿ'`’\-\. "
+RE_NAME_ANG = re.compile(rf'^[{NAME_CHARS}]+\s+[{NAME_CHARS}]+\s*<[^>]+>$')
+RE_USERNAME_STYLE = re.compile(r'^[A-Za-z0-9._-]+$')
+RE_BRACKETS = re.compile(r'\[[^\]]*\]')
+RE_FAKE_DOMAIN = re.compile(r'(?:no\.hostname\.specified|localhost|example\.com)', re.I)
+RE_WHITESPACE = re.compile(r'\s+')
+RE_ANGLE_ADDR = re.compile(r'<\s*([^>]+)\s*>')
+RE_EMAIL_PARTS = re.compile(r'^(?P<local>[^@]*)@(?P<domain>.*)$')
+RE_DIGIT = re.compile(r'[0-9]')
+RE_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+RE_SURROGATE = re.compile(r'[\ud800-\udfff]')
+RE_URL = re.compile(r'(?:http|www)\S+')
+# only tried at the start of a non-space run, a run that does not match there cannot match further in
+RE_MAIL = re.compile(r'(?<!\S)\S+@\S+')
+RE_PUNCT = re.compile(r'[^\w\s]')
+# str.translate table deleting the ASCII characters matched by RE_PUNCT
+_ASCII_PUNCT_TABLE = {c: None for c in range(128) if RE_PUNCT.match(chr(c))}
+
+# Free webmail providers
+FREE_DOMAINS: frozenset[str] = frozenset({
+    "gmail.com","yahoo.com","hotmail.com","outlook.com","aol.com","icloud.com",
+    "protonmail.com","wanadoo.fr","orange.fr","laposte.net","free.fr","sfr.fr",
+    "yandex.ru","mail.ru","zoho.com"
+})
+
+# Binary flag column -> sender category it marks
+SENDER_FLAGS = {
+    'is_mail_only': "mail_only",
+    'is_mail_paren_name': "mail_parentheses_lastname",
+    'is_name_angle': "lastname_firstname_angle",
+    'is_quoted_name': "quoted_lastname_firstname_angle",
+    'is_last_comma_first': "lastname_comma_firstname_angle",
+    'is_username_angle': "username_angle",
+    'is_display_angle': "display_angle",
+    'is_multi_mails': "multi_mails",
+    'is_mail_empty_parens': "mail_empty_parentheses",
+    'is_double_at': "mail_double_at",
+    'is_mail_with_brackets': "mail_with_brackets",
+    'is_fake_domain': "mail_fake_domain",
+    'is_other': "other",
+    'is_display_empty_angle': "display_empty_angle",
+    'is_quoted_text_no_email': "quoted_text_only",
+}
+# Sender categories indexed by their int8 code (position in SENDER_FLAGS), and the reverse lookup
+_CATEGORIES = np.array(list(SENDER_FLAGS.values()), dtype=object)
+_CATEGORY_CODES = {cat: code for code, cat in enumerate(_CATEGORIES)}
+
+def _factorize(values: pd.Series):
+    """
+    pd.factorize keeping NaN as a value. pandas hashes strings as UTF-8 and takes all lone
+    surrogates (e.g. from surrogateescape decoding) for the same character, so when some are
+    present the strings are factorized on their 'surrogatepass' bytes instead.
+    """
+    if values.dtype != object or not values.str.contains(RE_SURROGATE, na=False).any():
+        return pd.factorize(values, use_na_sentinel=False)
+    keys = values.map(lambda v: v.encode('utf-8', 'surrogatepass') if isinstance(v, str) else v)
+    codes, _ = pd.factorize(keys, use_na_sentinel=False)
+    # Codes are numbered in order of first appearance
+    return codes, values.to_numpy()[pd.Series(codes).drop_duplicates().index]
+
+def _entropies(strs: pd.Series) -> np.ndarray:
+    """
+    Shannon entropy (in bits) of each string of the Series, 0.0 for empty strings.
+    Computed once per unique string, for all of them at once with NumPy.
+    """
+    codes, uniques = _factorize(strs)
+    lengths = np.fromiter(map(len, uniques), dtype=np.int64, count=len(uniques))
+    values = np.zeros(len(uniques))
+    if lengths.sum():
+        # code points of all strings end to end (so non-ASCII characters are a single symbol),
+        # each tagged with the position of its string
+        chars = np.frombuffer(''.join(uniques).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        owner = np.repeat(np.arange(len(uniques), dtype=np.int64), lengths)
+        # code points fit in 21 bits, so each (string, character) pair gets a distinct key
+        keys, counts = np.unique((owner << 21) | chars, return_counts=True)
+        owner = keys >> 21
+        p = counts / lengths[owner]
+        values = np.bincount(owner, weights=-p * np.log2(p), minlength=len(uniques))
+    return values[codes]
+
+def _match_where(candidates: pd.Series, strs: pd.Series, test, fill=False):
+    """
+    Apply test (typically a regex through the .str accessor) only to the strings
+    flagged by candidates, a cheaper check the test implies; fill everywhere else.
+    """
+    if candidates.all():
+        return test(strs)
+    return test(strs[candidates]).reindex(strs.index, fill_value=fill)
+
+def _str_match(strs: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """
+    strs.str.match for a compiled pattern. Arrow strings only take the pattern source
+    (run by RE2), so it is passed as a string with re.I mapped to case=False.
+    """
+    return strs.str.match(pattern.pattern, case=not pattern.flags & re.I)
+
+def _str_search(strs: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """
+    strs.str.contains for a compiled pattern, see _str_match.
+    """
+    return strs.str.contains(pattern.pattern, case=not pattern.flags & re.I)
+
+def _has_digit(strs: pd.Series, is_digit) -> pd.Series:
+    """
+    Whether each string contains a character for which is_digit is true.
+    ASCII digits are found by RE_DIGIT, strings with non-ASCII characters
+    (e.g. Arabic-Indic digits in IDN domains) are then checked character by character.
+    """
+    has = _str_search(strs, RE_DIGIT).astype(bool)
+    to_check = ~has & _str_search(strs, RE_NON_ASCII).astype(bool)
+    return has | _match_where(to_check, strs, lambda s: s.map(lambda x: any(map(is_digit, x))).astype(bool))
+
+def _sender_features(senders: pd.Series) -> pd.DataFrame:
+    """
+    Compute the sender category, its binary flags and the enriched features
+    for a Series of raw sender strings. Returns a DataFrame aligned on senders.
+    """
+    # Cleaning sender strings, with Python's Unicode-aware \s so that plain spaces are the only
+    # whitespace left, then stored as Arrow strings so the .str methods below run as Arrow kernels.
+    # Lone surrogates (e.g. from surrogateescape decoding) are not valid UTF-8, such batches stay object dtype
+    senders = senders.fillna("").astype(str).str.replace(RE_WHITESPACE, ' ', regex=True).str.strip()
+    try:
+        senders = senders.astype("string[pyarrow]")
+    except UnicodeEncodeError:
+        pass
+
+    # Display and address parts of angle-bracket senders (NaN where RE_DISPLAY_ANGLE does not match)
+    angle_parts = _match_where(senders.str.contains("<", regex=False), senders,
+                               lambda s: s.str.extract(RE_DISPLAY_ANGLE), fill=np.nan)
+    is_angle = angle_parts['addr'].notna()
+    disp_core = angle_parts['disp'].fillna("").str.strip().str.strip('" ')
+
+    # Classification logic, rules are evaluated in priority order.
+    # Regexes only run on the senders passing a cheaper character test they imply.
+    rules = [
+        ("multi_mails", lambda r: r['sender'].str.contains(",", regex=False) & (r['n_at'] >= 2)),
+        ("mail_empty_parentheses", lambda r: _match_where(r['sender'].str.endswith(")"), r['sender'],
+                                                          lambda s: _str_match(s, RE_PAREN_EMPTY))),
+        ("mail_parentheses_lastname", lambda r: _match_where(r['sender'].str.endswith(")"), r['sender'],
+                                                             lambda s: _str_match(s, RE_PAREN_NAME))),
+        ("mail_with_brackets", lambda r: _match_where(r['sender'].str.contains("[", regex=False), r['sender'],
+                                                      lambda s: _str_search(s, RE_BRACKETS))),
+        ("mail_only", lambda r: _match_where(r['n_at'] == 1, r['sender'], lambda s: _str_match(s, RE_EMAIL_ONLY))),
+        ("mail_double_at", lambda r: r['n_at'] > 1),
+        ("mail_fake_domain", lambda r: _str_search(r['sender'], RE_FAKE_DOMAIN)),
+        ("quoted_lastname_firstname_angle", lambda r: _match_where(r['is_angle'], r['sender'],
+                                                                   lambda s: _str_match(s, RE_QUOTED_NAME_ANG))),
+        ("lastname_comma_firstname_angle", lambda r: _match_where(r['is_angle'], r['sender'],
+                                                                  lambda s: _str_match(s, RE_LAST_COMMA_FIRST))),
+        ("lastname_firstname_angle", lambda r: _match_where(r['is_angle'], r['sender'],
+                                                            lambda s: _str_match(s, RE_NAME_ANG))),
+        ("username_angle", lambda r: _match_where(r['is_angle'], r['disp_core'],
+                                                  lambda s: _str_match(s, RE_USERNAME_STYLE))),
+        ("display_angle", lambda r: r['is_angle']),
+        # Special cases
+        ("display_empty_angle", lambda r: r['sender'].isin(['"" <>', '""<>'])),
+        ("quoted_text_only", lambda r: r['sender'].str.startswith('"') & r['sender'].str.endswith('"')
+                                       & ~r['sender'].str.contains("@", regex=False)),
+    ]
+    # Each rule only scans the senders left unmatched by the previous ones
+    n_at = senders.str.count("@")
+    rows = pd.DataFrame({
+        'sender': senders.array,
+        'n_at': n_at.to_numpy(),
+        'is_angle': is_angle.to_numpy(),
+        'disp_core': disp_core.array,
+    })
+    # Categories are tracked as int8 codes, see _CATEGORY_CODES
+    codes = np.full(len(rows), _CATEGORY_CODES["other"], dtype=np.int8)
+    for cat, rule in rules:
+        if rows.empty:
+            break
+        hit = rule(rows).to_numpy(dtype=bool)
+        codes[rows.index[hit]] = _CATEGORY_CODES[cat]
+        rows = rows[~hit]
+
+    # Creation of categorical features
+    features = {"sender_category": _CATEGORIES[codes]}
+    for code, flag in enumerate(SENDER_FLAGS):
+        features[flag] = (codes == code).astype(np.int8)
+
+    # Creation of enriched features
+    # Email of the sender: inner part of <a@b>, else the cleaned string if it is a raw email
+    angle_email = angle_parts['addr'].str.extract(RE_ANGLE_ADDR)[0].str.strip()
+    is_email_only = _match_where(n_at == 1, senders, lambda s: _str_match(s, RE_EMAIL_ONLY))
+    email = angle_email.where(is_angle, senders.where(is_email_only, ""))
+    email_parts = email.str.extract(RE_EMAIL_PARTS).fillna("")
+    local, domain = email_parts['local'], email_parts['domain']
+
+    features.update({
+        "email_local_len": local.str.len().astype("int64"),
+        "email_domain_len": domain.str.len().astype("int64"),
+        "email_local_entropy": _entropies(local),
+        "email_local_has_digits": _has_digit(local, str.isdecimal).astype("int8"),
+        "email_local_has_underscore": local.str.contains("_", regex=False).astype("int8"),
+        "email_local_has_dot": local.str.contains(".", regex=False).astype("int8"),
+        "email_local_has_plus": local.str.contains("+", regex=False).astype("int8"),
+        "email_domain_is_free": domain.str.lower().isin(FREE_DOMAINS).astype("int8"),
+        "email_domain_has_digit": _has_digit(domain, str.isdigit).astype("int8"),
+        "email_domain_has_dash": domain.str.contains("-", regex=False).astype("int8"),
+    })
+
+    return pd.DataFrame(features, index=senders.index)
 
 def build_sender_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -19,163 +252,43 @@ def build_sender_features(df: pd.DataFrame) -> pd.DataFrame:
     - Extract enriched features such as display name, email local part, domain, TLD, SLD, lengths, entropy, and various boolean indicators.
     - Return the DataFrame with new features added.
     """
-    # Regex patterns
-    RE_EMAIL_ONLY = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$', re.I)
-    RE_PAREN_NAME = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+\s*\([^)]+\)\s*$', re.I)
-    RE_PAREN_EMPTY = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+\s*\(\s*\)\s*$', re.I)
-    RE_DISPLAY_ANGLE = re.compile(r'^(?P<disp>.*?)(?P<addr><\s*[^>]+@[^>]+\s*>)\s*$', re.I)
-    RE_QUOTED_NAME_ANG = re.compile(r'^"\s*[^"]+\s*"\s*<[^>]+>$', re.I)
-    RE_LAST_COMMA_FIRST = re.compile(r'^"?[^",<>]+,[^",<>]+"\s*<[^>]+>$', re.I)
-    NAME_CHARS = r"A-Za-zÀ-ÖØ-öø-ÿ'`’\-\. "
-    RE_NAME_ANG = re.compile(rf'^[{NAME_CHARS}]+\s+[{NAME_CHARS}]+\s*<[^>]+>$')
-    RE_USERNAME_STYLE = re.compile(r'^[A-Za-z0-9._-]+$')
-    RE_BRACKETS = re.compile(r'\[[^\]]*\]')
-    RE_FAKE_DOMAIN = re.compile(r'(no\.hostname\.specified|localhost|example\.com)', re.I)
-
-    def _clean(s: str) -> str:
-        """
-        Clean input string by removing extra whitespace and line breaks.
-        """
-        # handle NaN/None and ensure string
-        if pd.isna(s):
-            return ""
-        s = str(s)
-        return re.sub(r'\s+', ' ', s).strip()
-
-    def _split_display_angle(s: str) -> tuple[str, str]:
-        """
-        Return (display, email) when sender contains an angle-bracket address,
-        otherwise return ("", ""). The returned email is without surrounding <>.
-        """
-        if not s:
-            return "", ""
-        m = RE_DISPLAY_ANGLE.search(s)
-        if not m:
-            return "", ""
-        disp = m.group('disp').strip().strip('" ')
-        addr = m.group('addr')
-        # extract inner email from angle part like <a@b>
-        m2 = re.search(r'<\s*([^>]+)\s*>', addr)
-        email = m2.group(1).strip() if m2 else addr.strip()
-        return disp, email
-
-    cats, flag_dicts = [], []
-    for sender in df["sender"]:
-        
-        # Creation of categorical features
-        flags = OrderedDict.fromkeys([
-            'is_mail_only','is_mail_paren_name','is_name_angle','is_quoted_name',
-            'is_last_comma_first','is_username_angle','is_display_angle','is_multi_mails',
-            'is_mail_empty_parens','is_double_at','is_mail_with_brackets','is_fake_domain','is_other',
-            'is_display_empty_angle','is_quoted_text_no_email'
-        ], 0)
-        
-        # Cleaning sender string
-        sender_clean = _clean(sender)
-        if not sender_clean:
-            flags['is_other'] = 1
-            cats.append("other")
-            flag_dicts.append(flags)
-            continue
-        
-        # Classification logic
-        if "," in sender_clean and sender_clean.count("@") >= 2:
-            flags['is_multi_mails'] = 1
-            cats.append("multi_mails")
-        elif RE_PAREN_EMPTY.match(sender_clean):
-            flags['is_mail_empty_parens'] = 1
-            cats.append("mail_empty_parentheses")
-        elif RE_PAREN_NAME.match(sender_clean):
-            flags['is_mail_paren_name'] = 1
-            cats.append("mail_parentheses_lastname")
-        elif RE_BRACKETS.search(sender_clean):
-            flags['is_mail_with_brackets'] = 1
-            cats.append("mail_with_brackets")
-        elif RE_EMAIL_ONLY.match(sender_clean):
-            flags['is_mail_only'] = 1
-            cats.append("mail_only")
-        elif sender_clean.count("@") > 1:
-            flags['is_double_at'] = 1
-            cats.append("mail_double_at")
-        elif RE_FAKE_DOMAIN.search(sender_clean):
-            flags['is_fake_domain'] = 1
-            cats.append("mail_fake_domain")
-        else:
-            disp, angle = _split_display_angle(sender_clean)
-            if angle:
-                disp_core = disp.strip('" ')
-                if RE_QUOTED_NAME_ANG.match(sender_clean):
-                    flags['is_quoted_name'] = 1
-                    cats.append("quoted_lastname_firstname_angle")
-                elif RE_LAST_COMMA_FIRST.match(sender_clean):
-                    flags['is_last_comma_first'] = 1
-                    cats.append("lastname_comma_firstname_angle")
-                elif RE_NAME_ANG.match(sender_clean):
-                    flags['is_name_angle'] = 1
-                    cats.append("lastname_firstname_angle")
-                elif RE_USERNAME_STYLE.match(disp_core) and ' ' not in disp_core:
-                    flags['is_username_angle'] = 1
-                    cats.append("username_angle")
-                else:
-                    flags['is_display_angle'] = 1
-                    cats.append("display_angle")
-            
-            # Special cases
-            elif sender_clean.strip() in ['"" <>', '""<>']:
-                flags['is_display_empty_angle'] = 1
-                cats.append("display_empty_angle")
-            elif sender_clean.strip().startswith('"') and sender_clean.strip().endswith('"') and '@' not in sender_clean:
-                flags['is_quoted_text_no_email'] = 1
-                cats.append("quoted_text_only")
-            else:
-                flags['is_other'] = 1
-                cats.append("other")
-        flag_dicts.append(flags)
-
-    # Convert flag dicts to DataFrame and concatenate
-    fmt_df = pd.DataFrame(flag_dicts)
-    df["sender_category"] = cats
-    df = pd.concat([df, fmt_df], axis=1)
-
-    # Creation of enriched features
-    def _shannon_entropy(s):
-        if not s: return 0.0
-        c = Counter(s)
-        n = len(s)
-        return -sum((cnt/n)*math.log2(cnt/n) for cnt in c.values())
-
-    rows = []
-    for s in df["sender"]:
-        s_clean = _clean(s)
-        _, email = _split_display_angle(s_clean)
-        # if no angle-address, check if the cleaned string is a raw email
-        if not email and RE_EMAIL_ONLY.match(s_clean):
-            _, email = "", s_clean
-        local, domain = ("","")
-        if "@" in email:
-            local, domain = email.split("@",1)
-        rows.append({
-            "email_local_len": len(local),
-            "email_domain_len": len(domain),
-            "email_local_entropy": _shannon_entropy(local),
-            "email_local_has_digits": int(bool(re.search(r'\d', local))),
-            "email_local_has_underscore": int("_" in local),
-            "email_local_has_dot": int("." in local),
-            "email_local_has_plus": int("+" in local),
-            "email_domain_is_free": int(domain.lower() in {
-                "gmail.com","yahoo.com","hotmail.com","outlook.com","aol.com","icloud.com",
-                "protonmail.com","wanadoo.fr","orange.fr","laposte.net","free.fr","sfr.fr",
-                "yandex.ru","mail.ru","zoho.com"
-            }),
-            "email_domain_has_digit": int(any(ch.isdigit() for ch in domain)),
-            "email_domain_has_dash": int("-" in domain)
-        })
-
-    enrich_df = pd.DataFrame(rows)
-    df = pd.concat([df, enrich_df], axis=1)
+    # Features are computed once per distinct sender, then broadcast back to every row
+    codes, uniques = _factorize(df["sender"])
+    features = _sender_features(pd.Series(uniques, dtype=object))
+    for col in features.columns:
+        df[col] = features[col].to_numpy()[codes]
 
     return df
 
+def _strip_html(text: str) -> str:
+    """
+    Return the text content of an HTML (or plain text) string.
+    Text without '<' or '&' has no markup to parse and is returned as is.
+
+    >>> _strip_html('<title>Account <b>Alert</b></title><style>.a{color:red}</style>')
+    'Account Alert'
+    >>> _strip_html('<frameset>omega</frameset> &copyright; cpio -i <file')
+    'omega &copyright cpio -i <file'
+    """
+    if '<' not in text and '&' not in text:
+        return text
+    return BeautifulSoup(text, "html.parser").get_text()
+
+def _delete_punctuation(text: str) -> str:
+    """
+    Remove the characters matched by RE_PUNCT.
+    str.translate is much faster, but only the ASCII table is precomputed.
+    """
+    return text.translate(_ASCII_PUNCT_TABLE) if text.isascii() else RE_PUNCT.sub('', text)
+
+def _filter_and_lemmatize(text: str) -> str:
+    """
+    Tokenize on whitespace, drop stop words and lemmatize the remaining tokens.
+    """
+    # Tokenization, stop words deletion and lemmatization in a single pass
+    is_stop_word = _STOP_WORDS.__contains__
+    return ' '.join([_lemma(word) for word in text.split() if not is_stop_word(word)])
+
 def preprocess_mail_content(text: str) -> str:
     """
     Preprocess email content by performing the following steps:
@@ -192,27 +305,41 @@ def preprocess_mail_content(text: str) -> str:
         text = ""
     
     # 1. Delete HTML
-    text = BeautifulSoup(text, "html.parser").get_text()
+    text = _strip_html(text)
 
     # 2. Replace URLs/mails
-    text = re.sub(r'http\S+|www\S+|https\S+', '<URL>', text, flags=re.MULTILINE)
-    text = re.sub(r'\S+@\S+', '<EMAIL>', text)
+    text = RE_URL.sub('<URL>', text)
+    text = RE_MAIL.sub('<EMAIL>', text)
     
     # 3. Lowercase
     text = text.lower()
 
     # 4. Delete punctuation
-    text = re.sub(r'[^\w\s]', '', text)
+    text = _delete_punctuation(text)
 
-    # 5. Tokenization
-    tokens = text.split()
+    # 5-7. Tokenization, stop words and lemmatization
+    return _filter_and_lemmatize(text)
 
-    # 6. Delete stop words
-    stop_words = set(stopwords.words())
-    tokens = [word for word in tokens if word not in stop_words]
+def preprocess_mail_series(series: pd.Series) -> pd.Series:
+    """
+    Apply preprocess_mail_content to a whole Series of email contents.
+    Returns a Series with the same index.
+    """
+    return series.map(preprocess_mail_content)
 
-    # 7. Lemmatization
-    lemmatizer = WordNetLemmatizer()
-    tokens = [lemmatizer.lemmatize(word) for word in tokens]
+def preprocess_mail_series_parallel(series: pd.Series, n_jobs: int = -1) -> pd.Series:
+    """
+    Same as preprocess_mail_series, with the Series split into chunks processed
+    in parallel worker processes by joblib (n_jobs=-1 uses all cores).
+    Workers are fresh processes (loky backend) importing this module again, so each one
+    reloads the stop words and lemmatizer and starts with an empty _lemma cache:
+    only worth it for large Series.
+    Returns a Series with the same index.
+    """
+    # A few chunks per worker to balance emails of very different lengths
+    n_chunks = max(min(4 * effective_n_jobs(n_jobs), len(series)), 1)
+    bounds = np.linspace(0, len(series), n_chunks + 1, dtype=int)
+    chunks = [series.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
 
-    return ' '.join(tokens)
\ No newline at end of file
+    results = Parallel(n_jobs=n_jobs)(delayed(preprocess_mail_series)(chunk) for chunk in chunks)
+    return pd.concat(results)